@@ -280,9 +280,8 @@ def create_image_drillers(points, images, image_ids=None):
         driller = drillpoints.ItemDriller(image_item)
         drillers.append(driller)
         ds = gdal.Open(image, gdal.GA_ReadOnly)
-        for pt in points:
-            if pt.intersects(ds):
-                driller.add_point(pt)
+        for pt in drillpoints.filter_intersecting(points, ds):
+            driller.add_point(pt)
     return drillers
 
 
@@ -327,6 +326,7 @@ def create_stac_drillers(stac_client, points, collections, raster_assets=None,
         client = stac_client
 
     drillers = {}
+    drillpoints.calc_wgs84(points)
     for pt in points:
         pt_json = {
             "type": "Point",
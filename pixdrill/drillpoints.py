@@ -25,8 +25,12 @@ survey point's properties and are used to drill an ``Item's`` pixels.
 import traceback
 import math
 import logging
+import threading
+import collections
+from concurrent import futures
 from datetime import timezone
 
+import numpy
 from osgeo import osr
 
 from . import drill
@@ -44,11 +48,187 @@ ROI_SHP_CIRCLE = 'circle'
 Define a circle region of interest
 """
 
+MAX_ASSET_READERS = 8
+"""
+The maximum number of an ``Item's`` assets that are read concurrently
+"""
+
 
 class PointError(Exception):
     pass
 
 
+# osr.CoordinateTransformation objects are expensive to create and must not
+# be shared between threads. So each thread keeps its own cache of them.
+_THREAD_LOCAL = threading.local()
+
+# Guards the reads of the SRS objects shared by Points. See _local_srs.
+_SHARED_SRS_LOCK = threading.Lock()
+
+# The maximum number of entries in each of a thread's caches of SRSs and
+# transformations.
+_THREAD_CACHE_SIZE = 64
+
+
+def _thread_cache(name):
+    """
+    Return this thread's least-recently-used cache called `name`, creating
+    it on the first request. Use it with :func:`_cache_get` and
+    :func:`_cache_put`.
+
+    """
+    cache = getattr(_THREAD_LOCAL, name, None)
+    if cache is None:
+        cache = collections.OrderedDict()
+        setattr(_THREAD_LOCAL, name, cache)
+    return cache
+
+
+def _cache_get(cache, key):
+    """
+    Return the value for `key` in `cache`, or ``None`` if it isn't there,
+    and mark it as the most recently used.
+
+    """
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _cache_put(cache, key, value):
+    """
+    Add the `value` to `cache`, evicting the least recently used value if
+    the cache holds more than ``_THREAD_CACHE_SIZE`` values.
+
+    """
+    cache[key] = value
+    if len(cache) > _THREAD_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _time_window(t, t_delta):
+    """
+    Return the ``(start, end)`` datetimes of the window `t_delta` either
+    side of `t`. If `t_delta` is zero or ``None``, both are `t` itself.
+
+    The window is not cached: aware datetimes in different time zones
+    compare and hash equal if they are the same instant, so a cache could
+    return another point's window with a different ``tzinfo``.
+
+    """
+    if not t_delta:
+        window = (t, t)
+    else:
+        window = (t - t_delta, t + t_delta)
+    return window
+
+
+def _srs_key(srs):
+    """
+    Return a hashable key that identifies the osr.SpatialReference's
+    coordinate reference system.
+
+    The key is the ``(authority name, authority code)`` pair, e.g.
+    ``('EPSG', '4326')``, if the SRS has one; otherwise it is the
+    SRS's WKT string. Comparing keys is much cheaper than calling
+    ``IsSame``.
+
+    """
+    auth_name = srs.GetAuthorityName(None)
+    auth_code = srs.GetAuthorityCode(None)
+    if auth_name and auth_code:
+        key = (auth_name, auth_code)
+    else:
+        key = srs.ExportToWkt()
+    return key
+
+
+def _get_epsg_srs(epsg):
+    """
+    Return an osr.SpatialReference for the EPSG code, creating it on the
+    first request and reusing it thereafter.
+
+    Like the transformations, the SRSs are cached per thread. Callers must
+    not modify the returned object.
+
+    """
+    srs_cache = _thread_cache('srs_cache')
+    srs = _cache_get(srs_cache, epsg)
+    if srs is None:
+        srs = osr.SpatialReference()
+        srs.ImportFromEPSG(epsg)
+        _cache_put(srs_cache, epsg, srs)
+    return srs
+
+
+def _get_point_srs(epsg):
+    """
+    Return the osr.SpatialReference shared by the Points created in this
+    thread with the EPSG code, creating it on the first request.
+
+    The objects are cached separately from those of
+    :func:`_get_epsg_srs`, which the library uses as the destination of its
+    own transformations, so a change a user makes to a Point's ``sp_ref``
+    never reaches them.
+
+    """
+    point_srs_cache = _thread_cache('point_srs_cache')
+    srs = _cache_get(point_srs_cache, epsg)
+    if srs is None:
+        srs = osr.SpatialReference()
+        srs.ImportFromEPSG(epsg)
+        _cache_put(point_srs_cache, epsg, srs)
+    return srs
+
+
+def _local_srs(srs):
+    """
+    Return this thread's copy of the osr.SpatialReference `srs` and the
+    copy's key from :func:`_srs_key`, creating them on the first request
+    and reusing them thereafter.
+
+    A Point's ``sp_ref`` may be shared by many points and used by several
+    asset-reading threads at once, so the SRSs are only used through their
+    thread's copy. The copies are cached by the ``id`` of `srs`, and each
+    entry holds a reference to `srs` so that its ``id`` can't be reused
+    while it is cached. Only a cache miss reads the shared object, under
+    a lock.
+
+    """
+    local_srs = _thread_cache('local_srs')
+    entry = _cache_get(local_srs, id(srs))
+    if entry is None:
+        with _SHARED_SRS_LOCK:
+            srs_copy = srs.Clone()
+        entry = (srs, srs_copy, _srs_key(srs_copy))
+        _cache_put(local_srs, id(srs), entry)
+    return entry[1], entry[2]
+
+
+def _get_ct(src_srs, dst_srs, key):
+    """
+    Return an osr.CoordinateTransformation from `src_srs` to `dst_srs`,
+    creating it on the first request and reusing it thereafter. The cache
+    is keyed by `key`, the pair of the SRSs' keys from :func:`_local_srs`.
+
+    The transformation is created from clones of `src_srs` and `dst_srs`
+    configured with GDAL's OAMS_TRADITIONAL_GIS_ORDER axis mapping strategy,
+    so the caller's objects are never modified.
+
+    """
+    ct_cache = _thread_cache('ct_cache')
+    ct = _cache_get(ct_cache, key)
+    if ct is None:
+        src_clone = src_srs.Clone()
+        src_clone.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+        dst_clone = dst_srs.Clone()
+        dst_clone.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+        ct = osr.CoordinateTransformation(src_clone, dst_clone)
+        _cache_put(ct_cache, key, ct)
+    return ct
+
+
 class Point:
     """
     A structure for an X-Y-Time point with a coordinate reference system,
@@ -69,7 +249,8 @@ class Point:
     sp_ref : int or osr.SpatialReference
         The coordinate reference system of the point's `x`, `y` location.
         Integer's are interpreted as `EPSG codes <https://epsg.org/>`__
-        and used to create a GDAL osr.SpatialReference object.
+        and used to create a GDAL osr.SpatialReference object, which is
+        shared by all points created with the same EPSG code.
     t_delta : :class:`python:datetime.timedelta` object
         For searching STAC catalogues. An Item acquired within this time
         window either side of the point's time will be drilled, provided
@@ -100,11 +281,15 @@ class Point:
     x_y : tuple of float
         The point's (x, y) location.
     sp_ref : osr.SpatialReference
-        The osr.SpatialReference of (x, y).
+        The osr.SpatialReference of (x, y). Treat it as immutable; changing
+        it after the Point is created has undefined results. Points created
+        with the same EPSG code share the object.
     wgs84_x : float
-        The point's x location in WGS84 coordinates.
+        The point's x location in WGS84 coordinates. It is calculated the
+        first time it is used.
     wgs84_y : float
-        The point's y location in WGS84 coordinates.
+        The point's y location in WGS84 coordinates. It is calculated the
+        first time it is used.
     start_date : datetime.datetime
         The start date of the image-acquistion window.
     end_date : datetime.datetime
@@ -121,7 +306,19 @@ class Point:
     items : dictionary
         The items associated with this point, keyed by the Item ID.
 
+    Notes
+    -----
+    The attributes above are stored in ``__slots__`` to reduce the memory
+    used by large numbers of points. You may still attach your own
+    attributes to a Point using :func:`python:setattr`; they are stored in
+    the Point's ``__dict__``, which is only created when first needed.
+
     """
+    __slots__ = (
+        'x', 'y', 't', 'x_y', 'sp_ref', '_wgs84', 'start_date',
+        'end_date', 'buffer', 'shape', 'buffer_degrees', 'items', 'stats',
+        '__dict__')
+
     def __init__(self, x, y, t, sp_ref, t_delta, buffer, shape,
             buffer_degrees=False):
         """Point constructor."""
@@ -132,22 +329,44 @@ class Point:
             self.t = self.t.replace(tzinfo=timezone.utc)
         self.x_y = (self.x, self.y)
         if not isinstance(sp_ref, osr.SpatialReference):
-            sp_ref_osr = osr.SpatialReference()
-            sp_ref_osr.ImportFromEPSG(sp_ref)
-            self.sp_ref = sp_ref_osr
+            # Points created with the same EPSG code share one object.
+            self.sp_ref = _get_point_srs(sp_ref)
         else:
             self.sp_ref = sp_ref
-        self.wgs84_x, self.wgs84_y = self.to_wgs84()
-        self.wgs84_x = -180 if math.isclose(self.wgs84_x, 180) else \
-            self.wgs84_x
-        self.start_date = self.t - t_delta
-        self.end_date = self.t + t_delta
+        # The WGS84 coordinates are calculated on first use.
+        self._wgs84 = None
+        self.start_date, self.end_date = _time_window(self.t, t_delta)
         self.buffer = buffer
         self.shape = shape
         self.buffer_degrees = buffer_degrees
         self.items = {}
         self.stats = drillstats.PointStats(self)
 
+    @property
+    def wgs84_x(self):
+        """The point's x location in WGS84 coordinates."""
+        return self._get_wgs84()[0]
+
+    @property
+    def wgs84_y(self):
+        """The point's y location in WGS84 coordinates."""
+        return self._get_wgs84()[1]
+
+    def _get_wgs84(self):
+        """
+        Return the point's (x, y) location in WGS84 coordinates, calculating
+        it on the first call.
+
+        """
+        if self._wgs84 is None:
+            self._set_wgs84(*self.to_wgs84())
+        return self._wgs84
+
+    def _set_wgs84(self, wgs84_x, wgs84_y):
+        """Store the point's WGS84 coordinates."""
+        wgs84_x = -180 if math.isclose(wgs84_x, 180) else wgs84_x
+        self._wgs84 = (wgs84_x, wgs84_y)
+
     def intersects(self, ds):
         """
         Return True if the point intersects the GDAL dataset.
@@ -163,14 +382,13 @@ class Point:
         -------
         bool
 
+        See also
+        --------
+        :func:`~pixdrill.drillpoints.filter_intersecting` : to check many
+            points against the same dataset.
+
         """
-        iinfo = image_reader.ImageInfo(ds)
-        img_srs = osr.SpatialReference()
-        img_srs.ImportFromWkt(iinfo.projection)
-        pt_x, pt_y = self.transform(img_srs)
-        in_bounds = (pt_x >= iinfo.x_min and pt_x <= iinfo.x_max and
-                     pt_y >= iinfo.y_min and pt_y <= iinfo.y_max)
-        return in_bounds
+        return len(filter_intersecting([self], ds)) == 1
 
     def transform(self, dst_srs, src_srs=None, x=None, y=None):
         """
@@ -204,22 +422,25 @@ class Point:
 
         Under the hood, use GDAL's OAMS_TRADITIONAL_GIS_ORDER axis mapping
         strategies to guarantee x, y point ordering of the input and
-        output points.
+        output points. The strategies are set on copies of `src_srs` and
+        `dst_srs`; the originals are not modified.
+
+        If `src_srs` and `dst_srs` have the same authority code (or, lacking
+        one, the same WKT), then (x, y) is returned unchanged.
 
         """
         x = self.x if x is None else x
         y = self.y if y is None else y
-        src_srs = self.sp_ref if src_srs is None else src_srs
-        src_map_strat = src_srs.GetAxisMappingStrategy()
-        dst_map_strat = dst_srs.GetAxisMappingStrategy()
-        src_srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
-        dst_srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+        src_srs, src_key = _local_srs(
+            self.sp_ref if src_srs is None else src_srs)
+        dst_srs, dst_key = _local_srs(dst_srs)
+        if src_key == dst_key:
+            # No-op reprojection; don't construct a CoordinateTransformation.
+            return (x, y)
         # TODO: handle problems that may arise. See:
         # https://gdal.org/tutorials/osr_api_tut.html#coordinate-transformation
-        ct = osr.CoordinateTransformation(src_srs, dst_srs)
+        ct = _get_ct(src_srs, dst_srs, (src_key, dst_key))
         tr = ct.TransformPoint(x, y)
-        src_srs.SetAxisMappingStrategy(src_map_strat)
-        dst_srs.SetAxisMappingStrategy(dst_map_strat)
         return (tr[0], tr[1])
 
     def to_wgs84(self):
@@ -232,9 +453,7 @@ class Point:
         tuple of the new coords
 
         """
-        dst_srs = osr.SpatialReference()
-        dst_srs.ImportFromEPSG(4326)
-        return self.transform(dst_srs)
+        return self.transform(_get_epsg_srs(4326))
 
     def change_buffer_units(self, dst_srs):
         """
@@ -266,12 +485,13 @@ class Point:
         returning self.buffer as is.
 
         """
+        sp_ref = _local_srs(self.sp_ref)[0]
         if not self.buffer_degrees and dst_srs.IsGeographic():
             # Convert buffer units from metres to degrees
-            if self.sp_ref.IsProjected():
+            if sp_ref.IsProjected():
                 buffer = self._transformed_buffer(
                     self.x, self.y, self.buffer, self.sp_ref, dst_srs)
-            elif self.sp_ref.IsGeographic():
+            elif sp_ref.IsGeographic():
                 # Which CRS is the buffer distance defined in? We don't know.
                 # So convert x, y to the following projected CRS:
                 # - EPSG 32601 - 32660 for the northern hemisphere, and
@@ -280,8 +500,7 @@ class Point:
                     epsg = 32600 + int(self.wgs84_x / 6.0) + 31
                 else:
                     epsg = 32700 + int(self.wgs84_x / 6.0) + 31
-                p_sp_ref = osr.SpatialReference()
-                p_sp_ref.ImportFromEPSG(epsg)
+                p_sp_ref = _get_epsg_srs(epsg)
                 px, py = self.transform(p_sp_ref)
                 buffer = self._transformed_buffer(
                     px, py, self.buffer, p_sp_ref, dst_srs)
@@ -291,14 +510,13 @@ class Point:
                     "ERROR: unknown Spatial Reference type for sp_ref.")
         elif self.buffer_degrees and dst_srs.IsProjected():
             # Convert buffer units from degrees to metres
-            if self.sp_ref.IsProjected():
+            if sp_ref.IsProjected():
                 # Which CRS is the buffer distance defined in? We don't know.
                 # So, assume EPSG 4326.
-                g_sp_ref = osr.SpatialReference()
-                g_sp_ref.ImportFromEPSG(4326)
+                g_sp_ref = _get_epsg_srs(4326)
                 buffer = self._transformed_buffer(
                     self.wgs84_x, self.wgs84_y, self.buffer, g_sp_ref, dst_srs)
-            elif self.sp_ref.IsGeographic():
+            elif sp_ref.IsGeographic():
                 buffer = self._transformed_buffer(
                     self.x, self.y, self.buffer, self.sp_ref, dst_srs)
             else:
@@ -342,6 +560,114 @@ class Point:
         return new_buff
 
 
+def transform_points(points, dst_srs):
+    """
+    Transform the x, y locations of a list of points to the destination
+    osr.SpatialReference coordinate reference system.
+
+    Parameters
+    ----------
+    points : list of :class:`~pixdrill.drillpoints.Point` objects
+        The points to transform.
+    dst_srs : osr.SpatialReference
+        The destination SRS.
+
+    Returns
+    -------
+    tuple of numpy arrays
+        The transformed ``(xs, ys)`` coordinates, one element for each point.
+
+    Notes
+    -----
+    The points' coordinates are gathered into arrays, one for each of the
+    points' coordinate reference systems. Each array is transformed
+    with a single call to GDAL, which is much faster than transforming the
+    points one at a time with
+    :func:`~pixdrill.drillpoints.Point.transform`.
+
+    """
+    xs = numpy.empty(len(points), dtype=float)
+    ys = numpy.empty(len(points), dtype=float)
+    # Group the points by their SRS object, and then by their coordinate
+    # reference system, using this thread's copies of the SRSs.
+    by_object = {}
+    for idx, pt in enumerate(points):
+        by_object.setdefault(id(pt.sp_ref), (pt.sp_ref, []))[1].append(idx)
+    groups = {}
+    for sp_ref, idxs in by_object.values():
+        src_srs, src_key = _local_srs(sp_ref)
+        groups.setdefault(src_key, (src_srs, []))[1].extend(idxs)
+    dst_srs, dst_key = _local_srs(dst_srs)
+    for src_key, (src_srs, idxs) in groups.items():
+        coords = [points[idx].x_y for idx in idxs]
+        if src_key != dst_key:
+            ct = _get_ct(src_srs, dst_srs, (src_key, dst_key))
+            coords = ct.TransformPoints(coords)
+        coords = numpy.array(coords, dtype=float)
+        xs[idxs] = coords[:, 0]
+        ys[idxs] = coords[:, 1]
+    return (xs, ys)
+
+
+def calc_wgs84(points):
+    """
+    Calculate the WGS84 coordinates of a list of points in one batch.
+
+    Parameters
+    ----------
+    points : list of :class:`~pixdrill.drillpoints.Point` objects
+        The points to calculate the WGS84 coordinates for.
+
+    Notes
+    -----
+    A Point calculates its ``wgs84_x`` and ``wgs84_y`` attributes the first
+    time one of them is used, which costs one call to GDAL per point. Call
+    this function beforehand when the WGS84 coordinates of many points
+    are needed. Points whose WGS84 coordinates are already known are
+    skipped.
+
+    """
+    points = [pt for pt in points if pt._wgs84 is None]
+    xs, ys = transform_points(points, _get_epsg_srs(4326))
+    for pt, wgs84_x, wgs84_y in zip(points, xs.tolist(), ys.tolist()):
+        pt._set_wgs84(wgs84_x, wgs84_y)
+
+
+def filter_intersecting(points, ds):
+    """
+    Return the points that intersect the GDAL dataset.
+    The comparison is made using the image's coordinate reference system.
+
+    Parameters
+    ----------
+    points : list of :class:`~pixdrill.drillpoints.Point` objects
+        The points to check.
+    ds : An ``osgeo.gdal.Dataset`` object or ``str``
+        The file to check intersection with, it can be an open
+        GDAL Dataset or a filepath.
+
+    Returns
+    -------
+    list of :class:`~pixdrill.drillpoints.Point` objects
+        The points that intersect the dataset, in their original order.
+
+    Notes
+    -----
+    The dataset's information is read once and the points are transformed
+    together using :func:`~pixdrill.drillpoints.transform_points`, so this
+    is much faster than calling
+    :func:`~pixdrill.drillpoints.Point.intersects` for each point.
+
+    """
+    iinfo = image_reader.ImageInfo(ds)
+    img_srs = osr.SpatialReference()
+    img_srs.ImportFromWkt(iinfo.projection)
+    xs, ys = transform_points(points, img_srs)
+    in_bounds = ((xs >= iinfo.x_min) & (xs <= iinfo.x_max) &
+                 (ys >= iinfo.y_min) & (ys <= iinfo.y_max))
+    return [pt for pt, in_b in zip(points, in_bounds.tolist()) if in_b]
+
+
 class ItemDrillerError(Exception):
     pass
 
@@ -468,8 +794,12 @@ class ItemDriller:
         A single value is used for all bands in the image.
         None means to use the each band's no data value.
 
-        The reading is delegated to
-        :func:`pixdrill.image_reader.ImageReader.read_data`.
+        The reading of an image is delegated to
+        :func:`pixdrill.image_reader.ImageReader.read_data`, and the reading
+        of each asset of a :class:`pystac:pystac.Item` to
+        :func:`pixdrill.image_reader.ImageReader.read_rois`. The assets are
+        read concurrently, one thread per asset, up to
+        :attr:`~pixdrill.drillpoints.MAX_ASSET_READERS` threads.
 
         """
         read_ok = True
@@ -505,15 +835,23 @@ class ItemDriller:
                     raise ItemDrillerError(errmsg)
             else:
                 ignore_val = [ignore_val] * len(self.asset_ids)
+            # Read the assets concurrently; the reads are I/O bound and GDAL
+            # releases the GIL. The arrays are added to the points' stats
+            # afterwards, in asset order, in this thread.
             # GDAL will raise a RuntimeError if it can't open files,
             # in which case we write to the error log and roll back
             # all data read for the item because we can't guarantee a
             # clean read.
+            n_readers = min(len(self.asset_ids), MAX_ASSET_READERS)
+            with futures.ThreadPoolExecutor(
+                    max_workers=max(n_readers, 1)) as executor:
+                asset_futures = [
+                    executor.submit(self._read_asset, asset_id, i_v)
+                    for asset_id, i_v in zip(self.asset_ids, ignore_val)]
             try:
-                for asset_id, i_v in zip(self.asset_ids, ignore_val):
-                    reader = image_reader.ImageReader(
-                        self.item, asset_id=asset_id)
-                    reader.read_data(self.points, ignore_val=i_v)
+                asset_arr_infos = []
+                for asset_id, future in zip(self.asset_ids, asset_futures):
+                    asset_arr_infos.append(future.result())
             except RuntimeError:
                 fp = image_reader.get_asset_filepath(self.item, asset_id)
                 err_msg = f"Failed to read data for item {self.item.id} from "
@@ -522,7 +860,20 @@ class ItemDriller:
                 logging.error(err_msg)
                 self.reset_stats()
                 read_ok = False
+            else:
+                for arr_infos in asset_arr_infos:
+                    for pt, arr_info in zip(self.points, arr_infos):
+                        pt.stats.add_data(self.item, arr_info)
         return read_ok
+
+    def _read_asset(self, asset_id, ignore_val):
+        """
+        Read the pixels around every point for one raster asset and
+        return the list of :class:`~pixdrill.image_reader.ArrayInfo` objects.
+
+        """
+        reader = image_reader.ImageReader(self.item, asset_id=asset_id)
+        return reader.read_rois(self.points, ignore_val=ignore_val)
     
     def get_points(self):
         """
@@ -561,10 +912,20 @@ class ItemDriller:
             statistics function and how to retrieve the statistics from a
             :class:`~pixdrill.drillpoints.Point`.
 
+        Notes
+        -----
+        The standard statistics are calculated for all the points together
+        using :func:`~pixdrill.drillstats.calc_points_std_stats`, which
+        reduces the points' arrays of the same shape in one call. The
+        user-defined statistics are then calculated for each point.
+
         """
-        for pt in self.points:
-            pt.stats.calc_stats(
-                self.item.id, std_stats=std_stats, user_stats=user_stats)
+        if std_stats:
+            drillstats.calc_points_std_stats(
+                [pt.stats for pt in self.points], self.item.id, std_stats)
+        if user_stats:
+            for pt in self.points:
+                pt.stats.calc_stats(self.item.id, user_stats=user_stats)
 
     def get_item(self):
         """
@@ -24,13 +24,15 @@ for a :class:`~pixdrill.drillpoints.Point`.
 
 # The Set of standard statistics. See the STD_STATS_FUNCS dictionary at
 # the end of this module, which maps the statistic to a function.
+import functools
+
 import numpy
-import warnings
 
 
 STATS_RAW = 'raw'
 """
-Raw Data to be passsed to userFunc
+Raw Data to be passsed to userFunc. The arrays keep the raster's native
+data type.
 """
 STATS_ARRAYINFO = 'arrayinfo'
 """
@@ -53,7 +55,7 @@ STATS_COUNTNULL ='countnull'
 The number of null pixels in an array.
 Together, STATS_COUNT and STATS_COUNTNULL sum to the size of the array.
 """
-STATS_STD=[STATS_MEAN, STATS_STDEV, STATS_COUNT, STATS_COUNT]
+STATS_STD=[STATS_MEAN, STATS_STDEV, STATS_COUNT, STATS_COUNTNULL]
 """
 List of standard statistics.
 """
@@ -88,6 +90,8 @@ class PointStats:
         ``Item's`` ``assets``.
     
     """
+    __slots__ = ('pt', 'item_stats')
+
     def __init__(self, pt):
         """Constructor."""
         self.pt = pt
@@ -113,15 +117,16 @@ class PointStats:
 
         where ``arr_info.data`` is the :ref:`masked array <numpy:maskedarray>`
         of data containing the pixels for one of the assets of the item.
+        The array is stored in the raster's native data type; the standard
+        statistics promote to float64 only within their reductions.
         
         If item is a :class:`pystac:pystac.Item`, then
         :func:`~pixdrill.drillstats.PointStats.add_data()` may be called
         multiple times, once for each raster asset that is drilled.
 
         """
-        if item.id in self.item_stats:
-            stats = self.item_stats[item.id]
-        else:
+        stats = self.item_stats.get(item.id)
+        if stats is None:
             stats = {
                 ITEM_KEY: item,
                 STATS_RAW: [],
@@ -166,21 +171,9 @@ class PointStats:
         stats = self.item_stats[item_id]
         item = stats[ITEM_KEY]
         if std_stats:
-            # Check that all arrays are single-band.
-            # TODO: Permit std stats being calculated on multi-band images.
-            # See https://github.com/cibolabs/pixelstac/issues/30.
-            check_std_arrays(item, stats[STATS_RAW])
-            warnings.filterwarnings(
-                'ignore', category=UserWarning,
-                message='Warning: converting a masked element to nan')
             # Assume that STATS_RAW and STATS_ARRAYINFO are already populated
             # or are empty lists.
-            stats_list = [
-                s_s for s_s in std_stats if
-                s_s not in [STATS_RAW, STATS_ARRAYINFO]]
-            for stat_name in stats_list:
-                std_stat_func = STD_STATS_FUNCS[stat_name]
-                stats[stat_name] = std_stat_func(stats[STATS_RAW])
+            calc_points_std_stats([self], item_id, std_stats)
         if user_stats:
             for stat_name, stat_func in user_stats:
                 stats[stat_name] = stat_func(
@@ -312,19 +305,273 @@ def check_std_arrays(item, asset_arrays):
         Arrays to check.
 
     """
-    errmsg = ""
-    rast_counts = [arr.shape[0] for arr in asset_arrays]
-    for idx, rcount in enumerate(rast_counts):
-        if rcount > 1:
-            errmsg += f"Array at index {idx} in asset_arrays contains " \
-                      f"{rcount} layers.\n"
-    if errmsg:
+    # Only build the message if there is a multiband array.
+    multiband = [
+        (idx, arr.shape[0]) for idx, arr in enumerate(asset_arrays)
+        if arr.shape[0] > 1]
+    if multiband:
+        errmsg = "".join(
+            f"Array at index {idx} in asset_arrays contains {rcount} "
+            "layers.\n" for idx, rcount in multiband)
         errmsg = "ERROR: Cannot calculate the standard statistics " \
                  f"because one or more assets for item {item.id} " \
                  "has more than one band:\n " + errmsg
         raise MultibandAssetError(errmsg)
 
 
+@functools.lru_cache(maxsize=32)
+def _std_stats_to_calc(std_stats):
+    """
+    Return the tuple of statistics in the std_stats tuple that must be
+    calculated, i.e. all except STATS_RAW and STATS_ARRAYINFO.
+
+    The result is cached because the same std_stats are passed for every
+    point and every Item. A KeyError is raised for an unknown statistic.
+
+    """
+    stats_list = tuple(
+        s_s for s_s in std_stats if s_s not in (STATS_RAW, STATS_ARRAYINFO))
+    unknown = [s_s for s_s in stats_list if s_s not in STD_STATS_FUNCS]
+    if unknown:
+        raise KeyError(unknown[0])
+    return stats_list
+
+
+def _has_masked(arr):
+    """
+    Return True if at least one element of the masked array arr is masked.
+
+    """
+    mask = numpy.ma.getmask(arr)
+    return mask is not numpy.ma.nomask and mask.any()
+
+
+def _get_valid(arr):
+    """
+    Return the validity (the inverse of the mask) of the masked array arr,
+    or None if none of its elements are masked.
+
+    """
+    return ~numpy.ma.getmaskarray(arr) if _has_masked(arr) else None
+
+
+def _stack_arrays(asset_arrays):
+    """
+    Return the data and validity (the inverse of the mask) of the arrays in
+    asset_arrays stacked into two 4D ndarrays if they all have the same 3D
+    shape; otherwise return None.
+
+    Stacking lets the std stats reduce all arrays in one call
+    rather than one array at a time. The validity is None if none of
+    the arrays have masked elements.
+
+    """
+    stacked = None
+    if asset_arrays:
+        shape = asset_arrays[0].shape
+        if len(shape) == 3 and all(arr.shape == shape for arr in asset_arrays):
+            data = numpy.stack([numpy.ma.getdata(arr) for arr in asset_arrays])
+            valid = None
+            if any(_has_masked(arr) for arr in asset_arrays):
+                valid = ~numpy.stack(
+                    [numpy.ma.getmaskarray(arr) for arr in asset_arrays])
+            stacked = (data, valid)
+    return stacked
+
+
+def calc_std_stats(asset_arrays, stat_names):
+    """
+    Calculate several standard statistics for each masked array in the list
+    of asset_arrays, in a single pass over each array.
+
+    Parameters
+    ----------
+    asset_arrays : list of :ref:`numpy:maskedarray` of shape (1, ysize, xsize)
+        Arrays to calculate the statistics for.
+    stat_names : sequence of strings
+        The standard statistics to calculate. Each element must be one of
+        :attr:`~pixdrill.drillstats.STATS_MEAN`,
+        :attr:`~pixdrill.drillstats.STATS_STDEV`,
+        :attr:`~pixdrill.drillstats.STATS_COUNT` or
+        :attr:`~pixdrill.drillstats.STATS_COUNTNULL`.
+
+    Returns
+    -------
+    dictionary
+        Keyed by the statistic's name, in the order given by `stat_names`.
+        Each value is a 1D numpy array with one value for each input array.
+
+    Notes
+    -----
+    The statistics share intermediate results: the count of valid pixels
+    is calculated once and used for all four statistics, and the mean is
+    calculated once and used for the standard deviation.
+
+    """
+    # Calculate the stats for each array separately because their x and y
+    # sizes will differ if their pixel sizes are different; unless they are
+    # all the same shape, in which case calculate them together.
+    stacked = _stack_arrays(asset_arrays)
+    if stacked is not None:
+        data, valid = stacked
+        vals = _calc_arrays_stats(data, valid, (1, 2, 3), stat_names)
+    else:
+        vals = {
+            stat_name: numpy.empty(
+                len(asset_arrays), dtype=_STD_STATS_DTYPES[stat_name])
+            for stat_name in stat_names}
+        for idx, arr in enumerate(asset_arrays):
+            arr_vals = _calc_arrays_stats(
+                numpy.ma.getdata(arr), _get_valid(arr), None, stat_names)
+            for stat_name in stat_names:
+                vals[stat_name][idx] = arr_vals[stat_name]
+    return {stat_name: vals[stat_name] for stat_name in stat_names}
+
+
+def calc_points_std_stats(point_stats, item_id, std_stats):
+    """
+    Calculate the standard statistics for the given item for every
+    :class:`~pixdrill.drillstats.PointStats` object in point_stats.
+
+    Parameters
+    ----------
+    point_stats : list of :class:`~pixdrill.drillstats.PointStats`
+        The stats objects to calculate the statistics for. The raw arrays
+        for ``item_id`` must have been added to each of them.
+    item_id : str
+        The ``Item's`` ID, for which stats will be calculated.
+    std_stats : list of str
+        A list of ``STATS_*`` constants defined in the
+        :mod:`pixdrill.drillstats` module, defining the standard stats
+        to calculate.
+
+    Notes
+    -----
+    The raw arrays of all the points are grouped by shape and dtype, and
+    the statistics for each group are calculated in one call to
+    :func:`~pixdrill.drillstats.calc_std_stats`. The results are then
+    stored in each object's ``item_stats[item_id]`` dictionary, in the same
+    form as :func:`~pixdrill.drillstats.PointStats.calc_stats`.
+
+    Raises a :class:`~pixdrill.drillstats.MultibandAssetError` if any of
+    the arrays contains multiple bands. The arrays of all the points are
+    checked first, so none of their stats are changed when it is raised.
+
+    """
+    stats_list = _std_stats_to_calc(tuple(std_stats))
+    all_stats = [p_s.item_stats[item_id] for p_s in point_stats]
+    # Check that all arrays are single-band before any point's stats are
+    # changed, so that an error leaves every point as it was.
+    # TODO: Permit std stats being calculated on multi-band images.
+    # See https://github.com/cibolabs/pixelstac/issues/30.
+    for stats in all_stats:
+        check_std_arrays(stats[ITEM_KEY], stats[STATS_RAW])
+    if not stats_list:
+        return
+    # Map each array shape and dtype to the arrays of that shape and dtype
+    # and where their statistics belong: the point's new values and the
+    # index of the asset. Grouping by dtype too means that stacking the
+    # arrays never has to convert them to a common dtype.
+    groups = {}
+    # The new values for each point's stats. They are stored in the points'
+    # stats dictionaries once they have all been calculated.
+    new_vals = []
+    for stats in all_stats:
+        n_arrs = len(stats[STATS_RAW])
+        pt_vals = {
+            stat_name: numpy.empty(n_arrs, dtype=_STD_STATS_DTYPES[stat_name])
+            for stat_name in stats_list}
+        new_vals.append(pt_vals)
+        for idx, arr in enumerate(stats[STATS_RAW]):
+            group = groups.setdefault((arr.shape, arr.dtype), ([], []))
+            group[0].append(arr)
+            group[1].append((pt_vals, idx))
+    for arrs, targets in groups.values():
+        vals = calc_std_stats(arrs, stats_list)
+        for stat_name in stats_list:
+            stat_vals = vals[stat_name]
+            for (pt_vals, idx), val in zip(targets, stat_vals):
+                pt_vals[stat_name][idx] = val
+    for stats, pt_vals in zip(all_stats, new_vals):
+        stats.update(pt_vals)
+
+
+def _calc_arrays_stats(data, valid, axis, stat_names):
+    """
+    Return a dictionary with the requested standard statistics of the valid
+    elements of data, reduced along axis.
+
+    ``data`` and ``valid`` are plain ndarrays with the data and validity
+    (the inverse of the mask) of a masked array. The masked array methods
+    are avoided because they are much slower than the equivalent
+    ndarray reductions.
+
+    If ``valid`` is None then all elements are valid, and the reductions
+    run without a ``where`` argument.
+
+    """
+    vals = {}
+    size = data.size if axis is None else data[0].size
+    if valid is None:
+        where = True
+        if axis is None:
+            count = size
+        else:
+            count = numpy.full(len(data), size, dtype=numpy.intp)
+    else:
+        where = valid
+        count = numpy.count_nonzero(valid, axis=axis)
+    if STATS_COUNT in stat_names:
+        vals[STATS_COUNT] = count
+    if STATS_COUNTNULL in stat_names:
+        vals[STATS_COUNTNULL] = size - count
+    if STATS_MEAN in stat_names or STATS_STDEV in stat_names:
+        if not numpy.any(count):
+            # Every array is empty or fully masked, so skip the reductions.
+            # Each stat gets its own array of nans.
+            for stat_name in (STATS_MEAN, STATS_STDEV):
+                if stat_name in stat_names:
+                    if axis is None:
+                        vals[stat_name] = numpy.nan
+                    else:
+                        vals[stat_name] = numpy.full(len(data), numpy.nan)
+        else:
+            vals.update(_calc_mean_stdev(data, where, axis, count, stat_names))
+    return vals
+
+
+def _calc_mean_stdev(data, where, axis, count, stat_names):
+    """
+    Return a dictionary with the mean and, if it's in stat_names, the
+    standard deviation of the elements of data selected by where, reduced
+    along axis. count is the number of elements selected.
+
+    """
+    vals = {}
+    # The mean and stdev of zero valid elements are nan.
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        # Accumulate in float64 so that sums of integer pixels can't
+        # overflow and sums of float32 pixels don't lose precision.
+        total = numpy.add.reduce(
+            data, axis=axis, where=where, dtype=numpy.float64)
+        mean = total / count
+        vals[STATS_MEAN] = mean
+        if STATS_STDEV in stat_names:
+            # Use the two-pass algorithm, as MaskedArray.std does, which
+            # is more accurate than the one-pass sum of squares.
+            if axis is not None:
+                mean = numpy.expand_dims(mean, axis)
+            # Only calculate the deviations of the selected elements. The
+            # others may hold no data values, such as -DBL_MAX, that
+            # overflow when squared.
+            dev = numpy.zeros(data.shape, dtype=numpy.float64)
+            numpy.subtract(data, mean, out=dev, where=where)
+            numpy.square(dev, out=dev, where=where)
+            var = numpy.add.reduce(dev, axis=axis, where=where) / count
+            vals[STATS_STDEV] = numpy.sqrt(var)
+    return vals
+
+
 def std_stat_mean(asset_arrays):
     """
     Return a 1D array with the mean values for each masked array
@@ -341,16 +588,8 @@ def std_stat_mean(asset_arrays):
         The mean values - one for each input array.
 
     """
-    # Calculate the stat for each array because their x and y sizes will
-    # differ if their pixel sizes are different.
     # If all values in an array are masked, then mean=numpy.nan.
-    with warnings.catch_warnings():
-        warnings.filterwarnings(
-            'ignore', category=UserWarning,
-            message='Warning: converting a masked element to nan')
-        mean_vals = [arr.mean() for arr in asset_arrays]
-        return_val = numpy.array(mean_vals)
-    return return_val
+    return calc_std_stats(asset_arrays, [STATS_MEAN])[STATS_MEAN]
 
 
 def std_stat_stdev(asset_arrays):
@@ -369,16 +608,8 @@ def std_stat_stdev(asset_arrays):
         The stdev values - one for each input array.
 
     """
-    # Calculate the stat for each array because their x and y sizes will
-    # differ if their pixel sizes are different.
     # If all values in an array are masked, then stdev=numpy.nan.
-    with warnings.catch_warnings():
-        warnings.filterwarnings(
-            'ignore', category=UserWarning,
-            message='Warning: converting a masked element to nan')
-        stdev_vals = [arr.std() for arr in asset_arrays]
-        return_val = numpy.array(stdev_vals)
-    return return_val
+    return calc_std_stats(asset_arrays, [STATS_STDEV])[STATS_STDEV]
 
 
 def std_stat_count(asset_arrays):
@@ -397,8 +628,7 @@ def std_stat_count(asset_arrays):
         The count values - one for each input array.
 
     """
-    counts = [arr.count() for arr in asset_arrays]
-    return numpy.array(counts)
+    return calc_std_stats(asset_arrays, [STATS_COUNT])[STATS_COUNT]
 
 
 def std_stat_countnull(asset_arrays):
@@ -417,8 +647,7 @@ def std_stat_countnull(asset_arrays):
         The null counts - one for each input array.
 
     """
-    counts = [arr.mask.sum() for arr in asset_arrays]
-    return numpy.array(counts)
+    return calc_std_stats(asset_arrays, [STATS_COUNTNULL])[STATS_COUNTNULL]
 
 
 STD_STATS_FUNCS = {
@@ -430,3 +659,13 @@ STD_STATS_FUNCS = {
 """
 A mapping of the standard stats to their functions.
 """
+
+_STD_STATS_DTYPES = {
+    STATS_MEAN: numpy.float64,
+    STATS_STDEV: numpy.float64,
+    STATS_COUNT: numpy.int64,
+    STATS_COUNTNULL: numpy.int64
+}
+"""
+The data type of each standard statistic's values.
+"""
@@ -20,7 +20,6 @@ For reading pixel data and metadata from images.
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import math
 import numpy
 
 from osgeo import gdal
@@ -152,7 +151,8 @@ class ArrayInfo:
     Parameters
     ----------
     data : :ref:`masked array <numpy:maskedarray>`
-        The numpy masked array containing the pixel data.
+        The numpy masked array containing the pixel data, in the raster's
+        native data type.
     asset_id : string
         The ID of the STAC Item's asset from which the data was read.
     xoff, yoff, win_xsize, win_ysize : int
@@ -171,6 +171,10 @@ class ArrayInfo:
     The same as the above list of parameters.
 
     """
+    __slots__ = (
+        'data', 'asset_id', 'xoff', 'yoff', 'win_xsize', 'win_ysize',
+        'ulx', 'uly', 'lrx', 'lry', 'x_res', 'y_res')
+
     def __init__(
         self, data, asset_id, xoff, yoff, win_xsize, win_ysize,
             ulx, uly, lrx, lry, x_res, y_res):
@@ -250,6 +254,12 @@ class ImageReader:
         The GDAL dataset for filepath.
     info : :class:`~pixdrill.image_reader.ImageInfo`
         The ``ImageInfo`` object for the ``dataset``.
+    sp_ref : osr.SpatialReference
+        The coordinate reference system of the ``dataset``, created once
+        and shared by all points read from the ``dataset``.
+    inv_transform : list of floats
+        The inverse of ``info.transform``, for mapping map coords to
+        pixel coords.
 
     """
     def __init__(self, item, asset_id=None):
@@ -263,6 +273,11 @@ class ImageReader:
             self.filepath = get_asset_filepath(self.item, self.asset_id)
         self.dataset = gdal.Open(self.filepath, gdal.GA_ReadOnly)
         self.info = ImageInfo(self.dataset)
+        # Parse the projection once rather than for every point.
+        self.sp_ref = osr.SpatialReference()
+        self.sp_ref.ImportFromWkt(self.info.projection)
+        self.sp_ref.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+        self.inv_transform = gdal.InvGeoTransform(self.info.transform)
 
     def read_data(self, points, ignore_val=None):
         """
@@ -287,6 +302,29 @@ class ImageReader:
         :class:`~pixdrill.drillpoints.Point` will contain an
         :class:`~pixdrill.image_reader.ArrayInfo` object.
 
+        """
+        arr_infos = self.read_rois(points, ignore_val=ignore_val)
+        for pt, arr_info in zip(points, arr_infos):
+            pt.stats.add_data(self.item, arr_info)
+
+    def read_rois(self, points, ignore_val=None):
+        """
+        Read the pixel data around each of the given points, without adding
+        it to the points' stats.
+
+        Parameters
+        ----------
+        points : list of :class:`~pixdrill.drillpoints.Point` objects
+            Points to read from.
+        ignore_val : float
+            ignore value to use, if ``None`` then the image's no data value
+            is used.
+
+        Returns
+        -------
+        list of :class:`~pixdrill.image_reader.ArrayInfo` objects
+            One for each point, in the same order as `points`.
+
         """
         # Do a naive read, reading a small chunk of the image for every point.
         # The testing done to date shows that this is more efficient than
@@ -296,11 +334,21 @@ class ImageReader:
         # I suspect that there is a tipping point where it is more
         # efficient to read the entire image (or several large chunks) as the
         # number of points per image increases.
-        for pt in points:
-            arr_info = self.read_roi(pt, ignore_val=ignore_val)
-            pt.stats.add_data(self.item, arr_info)
-
-    def read_roi(self, pt, ignore_val=None):
+        # The pixel windows of all points are calculated together up front.
+        windows = self.get_pix_windows(points)
+        # Read the windows in row-major order, top to bottom and then left to
+        # right, so that consecutive reads tend to hit the same blocks in
+        # GDAL's block cache rather than jumping about the image.
+        order = sorted(
+            range(len(points)),
+            key=lambda idx: (windows[idx][1], windows[idx][0]))
+        arr_infos = [None] * len(points)
+        for idx in order:
+            arr_infos[idx] = self.read_roi(
+                points[idx], ignore_val=ignore_val, window=windows[idx])
+        return arr_infos
+
+    def read_roi(self, pt, ignore_val=None, window=None):
         """
         Extract the smallest number of pixels required to cover the region of
         interest.
@@ -313,6 +361,11 @@ class ImageReader:
         ignore_val : float
             ignore value to use, if ``None`` then the image's no data value
             is used.
+        window : tuple of int, optional
+            The point's ``(xoff, yoff, win_xsize, win_ysize)`` pixel window,
+            as returned by
+            :func:`~pixdrill.image_reader.ImageReader.get_pix_windows`.
+            If ``None``, it is calculated.
 
         Returns
         -------
@@ -325,7 +378,9 @@ class ImageReader:
         not touched by the ROI's boundary are masked using ``ignore_val``.
         
         The :class:`~pixdrill.image_reader.ArrayInfo` object contains a 3D
-        :ref:`masked array <numpy:maskedarray>` with the pixel data.
+        :ref:`masked array <numpy:maskedarray>` with the pixel data. The
+        array keeps the raster's native data type (e.g. ``uint16`` for
+        Sentinel-2); it is not converted to float.
         
         If ``ignore_val`` is ``None``, the
         no-data value set on each band in the image is used. If
@@ -338,7 +393,9 @@ class ImageReader:
 
         """
         # ROI bounds in pixel coordinates.
-        xoff, yoff, win_xsize, win_ysize = self.get_pix_window(pt)
+        if window is None:
+            window = self.get_pix_window(pt)
+        xoff, yoff, win_xsize, win_ysize = window
         # ROI bounds in image coordinates:
         # Coords of the upper-left pixel's upper-left corner
         ulx, uly = self.pix2wld(xoff, yoff)
@@ -421,51 +478,72 @@ class ImageReader:
         window was entirely outside of the image's extents.
 
         """
-        a_sp_ref = osr.SpatialReference()
-        a_sp_ref.ImportFromWkt(self.info.projection)
-        # Transform the point and buffer into same CRS as the image.
-        c_x, c_y = pt.transform(a_sp_ref)
-        buffer = pt.change_buffer_units(a_sp_ref)
-        if buffer > 0:
-            ul_geo_x = c_x - buffer
-            ul_geo_y = c_y + buffer
-            lr_geo_x = c_x + buffer
-            lr_geo_y = c_y - buffer
-            ul_px, ul_py = self.wld2pix(ul_geo_x, ul_geo_y)
-            lr_px, lr_py = self.wld2pix(lr_geo_x, lr_geo_y)
-            ul_px = math.floor(ul_px)
-            ul_py = math.floor(ul_py)
-            lr_px = math.ceil(lr_px)
-            lr_py = math.ceil(lr_py)
-            win_xsize = lr_px - ul_px
-            win_ysize = lr_py - ul_py
-            # Reduce the window size if it is straddles the image extents.
-            # If the resulting window is less than or equal to 0, the ROI is
-            # outside of the image's extents.
-            if ul_px < 0:
-                win_xsize = win_xsize + ul_px
-                ul_px = 0
-            elif ul_px + win_xsize > self.info.ncols:
-                win_xsize = self.info.ncols - ul_px
-            if ul_py < 0:
-                win_ysize = win_ysize + ul_py
-                ul_py = 0
-            elif ul_py + win_ysize >= self.info.nrows:
-                win_ysize = self.info.nrows - ul_py
-        else:
-            # The ROI is a singular point. Extract the pixel, but not if
-            # the point is outside the image's extents.
-            c_px, c_py = self.wld2pix(c_x, c_y)
-            ul_px = math.floor(c_px)
-            ul_py = math.floor(c_py)
-            if ul_px >= 0 and ul_px <= self.info.ncols and \
-               ul_py >= 0 and ul_py <= self.info.nrows:
-                win_xsize = 1
-                win_ysize = 1
-            else:
-                win_xsize = 0
-                win_ysize = 0
-        return (ul_px, ul_py, win_xsize, win_ysize)
+        return self.get_pix_windows([pt])[0]
+
+    def get_pix_windows(self, points):
+        """
+        Return the rectangular bounds of the region of interest of each point
+        in the image's pixel coordinate space.
+
+        Parameters
+        ----------
+
+        points : list of :class:`~pixdrill.drillpoints.Point` objects
+            Points to use
+
+        Returns
+        -------
+        list of tuples of int
+            The rectangular bounds in pixel coordinates as
+            ``(xoff, yoff, win_xsize, win_ysize)``, one tuple for each point.
+
+        Notes
+        -----
+        The bounding boxes of all points are calculated together using
+        numpy arrays. The rules for each window are described in
+        :func:`~pixdrill.image_reader.ImageReader.get_pix_window`.
+
+        """
+        # Transform the points and buffers into same CRS as the image.
+        c_x, c_y = drillpoints.transform_points(points, self.sp_ref)
+        buffers = [pt.change_buffer_units(self.sp_ref) for pt in points]
+        buffer = numpy.array(buffers, dtype=float)
+        ncols = self.info.ncols
+        nrows = self.info.nrows
+        # Bounding box corners in pixel coordinates.
+        ul_px, ul_py = self.wld2pix_array(c_x - buffer, c_y + buffer)
+        lr_px, lr_py = self.wld2pix_array(c_x + buffer, c_y - buffer)
+        ul_px = numpy.floor(ul_px)
+        ul_py = numpy.floor(ul_py)
+        win_xsize = numpy.ceil(lr_px) - ul_px
+        win_ysize = numpy.ceil(lr_py) - ul_py
+        # Reduce the window size if it is straddles the image extents.
+        # If the resulting window is less than or equal to 0, the ROI is
+        # outside of the image's extents.
+        win_xsize = numpy.where(
+            ul_px < 0, win_xsize + ul_px,
+            numpy.where(ul_px + win_xsize > ncols, ncols - ul_px, win_xsize))
+        ul_px = numpy.maximum(ul_px, 0)
+        win_ysize = numpy.where(
+            ul_py < 0, win_ysize + ul_py,
+            numpy.where(ul_py + win_ysize >= nrows, nrows - ul_py, win_ysize))
+        ul_py = numpy.maximum(ul_py, 0)
+        # Where the ROI is a singular point, extract the pixel, but not if
+        # the point is outside the image's extents.
+        singular = buffer <= 0
+        if singular.any():
+            c_px, c_py = self.wld2pix_array(c_x, c_y)
+            c_px = numpy.floor(c_px)
+            c_py = numpy.floor(c_py)
+            inside = ((c_px >= 0) & (c_px <= ncols) &
+                      (c_py >= 0) & (c_py <= nrows))
+            ul_px = numpy.where(singular, c_px, ul_px)
+            ul_py = numpy.where(singular, c_py, ul_py)
+            win_xsize = numpy.where(singular, inside, win_xsize)
+            win_ysize = numpy.where(singular, inside, win_ysize)
+        windows = numpy.stack(
+            [ul_px, ul_py, win_xsize, win_ysize], axis=1).astype(int)
+        return [tuple(win) for win in windows.tolist()]
 
     def mask_roi_shape(self, pt, arr_info, ignore_val):
         """
@@ -521,11 +599,9 @@ class ImageReader:
             # the pixel is inside the circle. A corner is outside the circle if
             # it's distance to the circle's centre is greater than the circle's
             # radius.
-            a_sp_ref = osr.SpatialReference()
-            a_sp_ref.ImportFromWkt(self.info.projection)
             # Circle centre and radius in the same CRS as the image.
-            c_x, c_y = pt.transform(a_sp_ref)
-            radius = pt.change_buffer_units(a_sp_ref)
+            c_x, c_y = pt.transform(self.sp_ref)
+            radius = pt.change_buffer_units(self.sp_ref)
 
             def outside(lower, right):
                 # Return an array where True means the pixels's corner is
@@ -570,8 +646,26 @@ class ImageReader:
         tuple of ``(x, y)``
 
         """
-        inv_transform = gdal.InvGeoTransform(self.info.transform)
-        x, y = gdal.ApplyGeoTransform(inv_transform, geox, geoy)
+        x, y = gdal.ApplyGeoTransform(self.inv_transform, geox, geoy)
+        return (x, y)
+
+    def wld2pix_array(self, geox, geoy):
+        """
+        Convert arrays of map coords to pixel coords.
+
+        Parameters
+        ----------
+        geox, geoy : numpy array of float
+            The input coordinates.
+
+        Returns
+        -------
+        tuple of numpy arrays ``(x, y)``
+
+        """
+        inv = self.inv_transform
+        x = inv[0] + inv[1] * geox + inv[2] * geoy
+        y = inv[3] + inv[4] * geox + inv[5] * geoy
         return (x, y)
 
     def pix2wld(self, x, y):
@@ -1,5 +1,7 @@
 """Tests for drillpoints.py"""
 
+import datetime
+
 import pytest
 from osgeo import osr
 
@@ -31,6 +33,31 @@ def test_point(point_albers):
     assert round(point_albers.wgs84_y, 1) == -10.7
 
 
+def test_point_time_window_tz():
+    """Test a Point's window keeps its own tzinfo for the same instant."""
+    t_delta = datetime.timedelta(days=3)
+    t_utc = datetime.datetime(2022, 7, 28, tzinfo=datetime.timezone.utc)
+    tz_aest = datetime.timezone(datetime.timedelta(hours=10))
+    t_aest = t_utc.astimezone(tz_aest)
+    pt_utc = drillpoints.Point(0, -1123600, t_utc, 3577, t_delta, 50,
+        drillpoints.ROI_SHP_SQUARE)
+    pt_aest = drillpoints.Point(0, -1123600, t_aest, 3577, t_delta, 50,
+        drillpoints.ROI_SHP_SQUARE)
+    assert pt_utc.start_date.tzinfo == datetime.timezone.utc
+    assert pt_aest.start_date.tzinfo == tz_aest
+    assert pt_aest.end_date.tzinfo == tz_aest
+    assert pt_aest.start_date == t_aest - t_delta
+
+
+def test_point_sp_ref(point_wgs84):
+    """
+    Test that a Point's sp_ref isn't the library's own SRS, so changing it
+    doesn't change the SRS that points are transformed to.
+
+    """
+    assert point_wgs84.sp_ref is not drillpoints._get_epsg_srs(4326)
+
+
 def test_point_transform(point_albers):
     """Test Point.transform."""
     dst_srs = osr.SpatialReference()
@@ -55,6 +82,41 @@ def test_point_transform(point_albers):
     assert round(t_y, 2) == -1123600.00
 
 
+def test_point_transform_identity(point_albers):
+    """Test Point.transform returns the coordinates when the SRSs match."""
+    dst_srs = osr.SpatialReference()
+    dst_srs.ImportFromEPSG(3577)
+    assert point_albers.transform(dst_srs) == (0, -1123600)
+    # A separate SRS object with the same EPSG code, and alternative x, y.
+    src_srs = osr.SpatialReference()
+    src_srs.ImportFromEPSG(3577)
+    assert point_albers.transform(
+        dst_srs, src_srs=src_srs, x=10, y=-1123610) == (10, -1123610)
+
+
+def test_srs_key():
+    """Test drillpoints._srs_key."""
+    srs = osr.SpatialReference()
+    srs.ImportFromEPSG(4326)
+    assert drillpoints._srs_key(srs) == ('EPSG', '4326')
+    # An SRS without an authority is keyed by its WKT.
+    srs = osr.SpatialReference()
+    srs.ImportFromProj4(
+        "+proj=aea +lat_1=-18 +lat_2=-36 +lat_0=0 +lon_0=132 "
+        "+x_0=0 +y_0=0 +ellps=GRS80 +units=m +no_defs")
+    assert srs.GetAuthorityCode(None) is None
+    assert drillpoints._srs_key(srs) == srs.ExportToWkt()
+
+
+def test_calc_wgs84(point_albers, point_wgs84):
+    """Test drillpoints.calc_wgs84."""
+    drillpoints.calc_wgs84([point_albers, point_wgs84])
+    assert round(point_albers.wgs84_x, 1) == 132.0
+    assert round(point_albers.wgs84_y, 1) == -10.7
+    assert point_wgs84.wgs84_x == 140
+    assert point_wgs84.wgs84_y == -36.5
+
+
 def test_point_change_buffer_units(
     point_albers, point_albers_buffer_degrees,
     point_wgs84, point_wgs84_buffer_degrees):
@@ -104,6 +166,15 @@ def test_point_intersects(
     assert not point_outside_bounds_1.intersects(real_image_path)
 
 
+def test_filter_intersecting(
+        point_one_item, point_outside_bounds_1, point_wgs84, real_image_path):
+    """Test drillpoints.filter_intersecting."""
+    points = [point_outside_bounds_1, point_one_item, point_wgs84]
+    assert drillpoints.filter_intersecting(
+        points, real_image_path) == [point_one_item]
+    assert drillpoints.filter_intersecting([], real_image_path) == []
+
+
 def test_item_driller(real_item):
     """Test the ItemDriller constructor."""
     drlr = drillpoints.ItemDriller(real_item)
@@ -6,6 +6,7 @@ import pytest
 from pixdrill import drill
 from pixdrill import drillstats
 from pixdrill import drillpoints
+from pixdrill import image_reader
 from .fixtures import point_one_item, real_item, real_image_path
 from .fixtures import fake_item, point_partial_nulls, point_all_nulls
 from .fixtures import point_straddle_bounds_1, point_outside_bounds_1
@@ -141,6 +142,47 @@ def test_std_stat_mean():
     assert list(mean_vals)[1:] == [4.0, 7.0]
 
 
+def test_std_stat_float64():
+    """
+    Test that drillstats.std_stat_mean and std_stat_stdev accumulate and
+    return float64 values, even for float32 arrays.
+
+    """
+    a1 = numpy.array([0.1, 0.2, 0.3, 0.7], dtype=numpy.float32).reshape(
+        (1, 2, 2))
+    m_a1 = numpy.ma.masked_array(a1)
+    m_a2 = numpy.ma.masked_array(a1[:, :1])
+    # Stacked and unstacked.
+    for arrs in ([m_a1, m_a1], [m_a1, m_a2]):
+        mean_vals = drillstats.std_stat_mean(arrs)
+        assert mean_vals.dtype == numpy.float64
+        assert mean_vals[0] == a1.astype(numpy.float64).mean()
+        stdev_vals = drillstats.std_stat_stdev(arrs)
+        assert stdev_vals.dtype == numpy.float64
+        assert numpy.isclose(
+            stdev_vals[0], a1.astype(numpy.float64).std(), rtol=0, atol=1e-15)
+
+
+@pytest.mark.filterwarnings("error::RuntimeWarning")
+def test_std_stat_stdev_extreme_nodata():
+    """
+    Test that drillstats.std_stat_stdev ignores masked elements that
+    would overflow if they were squared.
+
+    """
+    nodata = -numpy.finfo(numpy.float64).max
+    a1 = numpy.array([1, 2, 3, nodata], dtype=numpy.float64).reshape(
+        (1, 2, 2))
+    m_a1 = numpy.ma.masked_array(a1, mask=a1==nodata)
+    m_a2 = numpy.ma.masked_array(a1 + 1, mask=a1==nodata)
+    m_a3 = numpy.ma.masked_array(a1[:, :1], mask=a1[:, :1]==nodata)
+    # Stacked and unstacked.
+    for arrs in ([m_a1, m_a2], [m_a1, m_a3]):
+        stdev_vals = drillstats.std_stat_stdev(arrs)
+        assert numpy.isclose(stdev_vals[0], m_a1.std())
+    assert numpy.isclose(stdev_vals[0], 0.816496580927726)
+
+
 def test_std_stat_count():
     """Test drillstats.std_stat_count."""
     a1 = numpy.arange(10).reshape((1, 2, 5))
@@ -161,6 +203,107 @@ def test_std_stat_countnull():
     assert list(counts) == [3, 0, 0]
 
 
+def test_calc_std_stats():
+    """Test drillstats.calc_std_stats."""
+    a1 = numpy.arange(10).reshape((1, 2, 5))
+    m_a1 = numpy.ma.masked_array(a1, mask=a1<3)
+    m_a2 = numpy.ma.arange(4, 20).reshape((1, 4, 4))
+    m_a3 = numpy.ma.masked_array([], mask=True)
+    stat_names = [
+        drillstats.STATS_COUNTNULL, drillstats.STATS_MEAN,
+        drillstats.STATS_STDEV, drillstats.STATS_COUNT]
+    stats = drillstats.calc_std_stats([m_a1, m_a2, m_a3], stat_names)
+    assert list(stats.keys()) == stat_names
+    assert list(stats[drillstats.STATS_COUNT]) == [7, 16, 0]
+    assert list(stats[drillstats.STATS_COUNTNULL]) == [3, 0, 0]
+    assert list(stats[drillstats.STATS_MEAN][:2]) == [6.0, 11.5]
+    assert numpy.isnan(stats[drillstats.STATS_MEAN][2])
+    assert numpy.allclose(
+        stats[drillstats.STATS_STDEV][:2], [m_a1.std(), m_a2.std()])
+    assert numpy.isnan(stats[drillstats.STATS_STDEV][2])
+    # Arrays of the same shape are calculated together.
+    m_a4 = numpy.ma.masked_array(a1 * 2, mask=a1>7)
+    stats = drillstats.calc_std_stats([m_a1, m_a4], stat_names)
+    assert list(stats[drillstats.STATS_COUNT]) == [7, 8]
+    assert list(stats[drillstats.STATS_COUNTNULL]) == [3, 2]
+    assert list(stats[drillstats.STATS_MEAN]) == [6.0, 7.0]
+    assert numpy.allclose(
+        stats[drillstats.STATS_STDEV], [m_a1.std(), m_a4.std()])
+    # Arrays without masked elements, stacked and unstacked.
+    m_a5 = numpy.ma.masked_array(a1, mask=numpy.zeros(a1.shape, dtype=bool))
+    for arrs in ([m_a5, m_a4], [m_a5, m_a2]):
+        stats = drillstats.calc_std_stats(arrs, stat_names)
+        assert stats[drillstats.STATS_COUNT][0] == 10
+        assert stats[drillstats.STATS_COUNTNULL][0] == 0
+        assert stats[drillstats.STATS_MEAN][0] == 4.5
+        assert numpy.isclose(stats[drillstats.STATS_STDEV][0], a1.std())
+
+
+def test_calc_std_stats_all_masked():
+    """
+    Test drillstats.calc_std_stats returns a separate array for each stat
+    when every array is fully masked.
+
+    """
+    a1 = numpy.arange(10).reshape((1, 2, 5))
+    m_a1 = numpy.ma.masked_array(a1, mask=True)
+    m_a2 = numpy.ma.masked_array(a1 * 2, mask=True)
+    stat_names = [drillstats.STATS_MEAN, drillstats.STATS_STDEV]
+    stats = drillstats.calc_std_stats([m_a1, m_a2], stat_names)
+    assert stats[drillstats.STATS_MEAN] is not stats[drillstats.STATS_STDEV]
+    assert numpy.isnan(stats[drillstats.STATS_MEAN]).all()
+    assert numpy.isnan(stats[drillstats.STATS_STDEV]).all()
+    stats[drillstats.STATS_MEAN][0] = 5
+    assert numpy.isnan(stats[drillstats.STATS_STDEV][0])
+
+
+def test_calc_points_std_stats(fake_item):
+    """Test drillstats.calc_points_std_stats."""
+    a1 = numpy.arange(10).reshape((1, 2, 5))
+    arrs = [
+        [numpy.ma.masked_array(a1, mask=a1<3),
+         numpy.ma.arange(4, 20).reshape((1, 4, 4))],
+        [numpy.ma.masked_array(a1 * 2, mask=a1>7),
+         numpy.ma.masked_array([], mask=True)],
+        []]
+    point_stats = []
+    for pt_arrs in arrs:
+        p_s = drillstats.PointStats(None)
+        p_s.reset(item=fake_item)
+        for arr in pt_arrs:
+            arr_info = image_reader.ArrayInfo(
+                arr, "B02", 0, 0, 0, 0, 0, 0, 0, 0, 10, 10)
+            p_s.add_data(fake_item, arr_info)
+        point_stats.append(p_s)
+    stat_names = [drillstats.STATS_MEAN, drillstats.STATS_COUNT]
+    drillstats.calc_points_std_stats(point_stats, fake_item.id, stat_names)
+    for p_s, pt_arrs in zip(point_stats, arrs):
+        stats = p_s.item_stats[fake_item.id]
+        assert list(stats.keys())[3:] == stat_names
+        expected = drillstats.calc_std_stats(pt_arrs, stat_names)
+        for stat_name in stat_names:
+            assert numpy.array_equal(
+                stats[stat_name], expected[stat_name], equal_nan=True)
+    # Requesting only the raw arrays adds no stats.
+    point_stats[0].reset(item=fake_item)
+    arr_info = image_reader.ArrayInfo(
+        arrs[0][0], "B02", 0, 0, 0, 0, 0, 0, 0, 0, 10, 10)
+    point_stats[0].add_data(fake_item, arr_info)
+    drillstats.calc_points_std_stats(
+        point_stats[:1], fake_item.id, [drillstats.STATS_RAW])
+    assert len(point_stats[0].item_stats[fake_item.id]) == 3
+    # A multiband array in a later point leaves the earlier points unchanged.
+    mba = numpy.ma.arange(20).reshape((2, 2, 5))
+    arr_info = image_reader.ArrayInfo(
+        mba, "B02", 0, 0, 0, 0, 0, 0, 0, 0, 10, 10)
+    point_stats[2].add_data(fake_item, arr_info)
+    with pytest.raises(drillstats.MultibandAssetError):
+        drillstats.calc_points_std_stats(
+            point_stats, fake_item.id, [drillstats.STATS_COUNTNULL])
+    for p_s in point_stats:
+        assert drillstats.STATS_COUNTNULL not in p_s.item_stats[fake_item.id]
+
+
 def test_handle_nulls(point_partial_nulls, point_all_nulls, real_item):
     """
     Test handling of null values in the arrays when calculating stats.
@@ -362,6 +505,9 @@ def test_get_stats(point_one_item, real_item):
     assert stats == {real_item.id: None}
     stats = point_one_item.stats.get_stats(stat_name=drillstats.STATS_COUNT)
     assert stats == {real_item.id: []}
+    stats = point_one_item.stats.get_stats(
+        stat_name=drillstats.STATS_COUNTNULL)
+    assert stats == {real_item.id: []}
     stats = point_one_item.stats.get_stats(
         item_id="No such item", stat_name="No such stat")
     assert stats is None
@@ -2,6 +2,8 @@
 
 import math
 
+import numpy
+
 from osgeo import gdal
 
 from pixdrill import image_reader
@@ -88,6 +90,31 @@ def test_get_pix_window(real_item, point_one_item, point_wgs84_buffer_degrees):
     assert win_ysize == 6
 
 
+def test_get_pix_windows(
+    real_item, point_one_item, point_one_item_singular,
+    point_straddle_bounds_1, point_outside_bounds_1):
+    """
+    Test ImageReader.get_pix_windows on a batch of buffered, singular,
+    straddling and outside points.
+
+    """
+    reader = image_reader.ImageReader(real_item, asset_id='blue')  # 10 m pixels
+    points = [
+        point_one_item, point_one_item_singular, point_straddle_bounds_1,
+        point_outside_bounds_1]
+    windows = reader.get_pix_windows(points)
+    assert len(windows) == len(points)
+    # Each window matches the one calculated for the point on its own.
+    assert windows == [reader.get_pix_window(pt) for pt in points]
+    assert windows[0] == (3428, 4044, 11, 11)
+    # A singular point's window is its one pixel.
+    assert windows[1][2:] == (1, 1)
+    # The straddling window is clipped to the image's UL corner.
+    assert windows[2] == (0, 0, 6, 6)
+    # The outside window is empty.
+    assert windows[3][2] <= 0 or windows[3][3] <= 0
+
+
 def test_read_roi(real_item, point_one_item):
     """Test ImageReader.read_roi()."""
     # point_one_item intersects this file
@@ -99,6 +126,7 @@ def test_read_roi(real_item, point_one_item):
     arr_info = reader.read_roi(point_one_item)
     arr = arr_info.data
     assert arr.shape == (1, 11, 11)
+    assert arr.dtype == numpy.uint16
     assert arr[0, 0, 0] == 406
     assert arr[0, 0, 1] == 426
     assert arr[0, 1, 0] == 372
@@ -138,6 +166,29 @@ def test_read_roi(real_item, point_one_item):
     assert arr_info.y_res == 20.0
 
 
+def test_read_rois(
+    real_item, point_one_item, point_straddle_bounds_1,
+    point_straddle_bounds_2):
+    """
+    Test ImageReader.read_rois() returns the ROIs in the order of the points,
+    not the row-major order in which they are read.
+
+    """
+    reader = image_reader.ImageReader(real_item, asset_id='blue')
+    # Lower right, middle, then upper left of the image.
+    points = [point_straddle_bounds_2, point_one_item, point_straddle_bounds_1]
+    arr_infos = reader.read_rois(points)
+    assert len(arr_infos) == len(points)
+    windows = reader.get_pix_windows(points)
+    for arr_info, window in zip(arr_infos, windows):
+        assert (arr_info.xoff, arr_info.yoff) == window[:2]
+    assert arr_infos[0].data.shape == (1, 5, 5)
+    assert arr_infos[1].data.shape == (1, 11, 11)
+    assert arr_infos[1].data[0, 0, 0] == 406
+    assert arr_infos[2].data.shape == (1, 6, 6)
+    assert arr_infos[2].data[0, 0, 0] == 3852
+
+
 def test_read_roi_with_nulls(real_item, point_partial_nulls, point_all_nulls):
     """
     Test ImageReader.read_roi() for two special cases: